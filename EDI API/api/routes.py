@@ -16,6 +16,7 @@ from services.edi_converter import convert_xml_to_edi
 from services.edi_parser import convert_edi_to_xml, validate_edi_format, parse_edi_to_dict
 from services.file_utils import write_file_async
 from services.file_transfer_client import upload_edi_file_unified
+from services.transfer_scheduler import PRIORITY_HIGH, get_scheduler
 from config import config
 
 logger = logging.getLogger(__name__)
@@ -168,7 +169,9 @@ def generate_codeco():
                         config.TRANSFER_REMOTE_DIR,
                         config.TRANSFER_PROTOCOL,
                         config.TRANSFER_MAX_RETRIES,
-                        config.TRANSFER_RETRY_DELAY
+                        config.TRANSFER_RETRY_DELAY,
+                        # Live gate traffic goes ahead of backlog resends
+                        priority=PRIORITY_HIGH
                     )
                 )
 
@@ -435,3 +438,19 @@ def health_check():
         "status": "healthy",
         "timestamp": datetime.now(timezone.utc).isoformat()
     }), 200
+
+
+@codeco_bp.route('/transfers/stats', methods=['GET'])
+def transfer_stats():
+    """
+    Transfer scheduler statistics.
+
+    Returns:
+        JSON response with worker usage, queue depth per priority lane,
+        in-flight transfers per host and queue wait times in seconds.
+    """
+    return jsonify({
+        "status": "success",
+        "scheduler": get_scheduler().stats(),
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }), 200
@@ -9,6 +9,7 @@ from flasgger import Swagger
 import logging
 from config import config
 from api.routes import codeco_bp
+from services.transfer_scheduler import configure_scheduler
 
 # Configure logging
 logging.basicConfig(
@@ -43,6 +44,12 @@ def create_app(config_obj=None):
 
     app.config['JSON_SORT_KEYS'] = False
 
+    # Size the shared transfer scheduler from configuration
+    configure_scheduler(
+        max_workers=config_obj.TRANSFER_WORKERS,
+        per_host_limit=config_obj.TRANSFER_PER_HOST_LIMIT
+    )
+
     # Register blueprints
     app.register_blueprint(codeco_bp)
 
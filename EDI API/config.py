@@ -43,6 +43,10 @@ class Config:
     TRANSFER_MAX_RETRIES = int(os.getenv('TRANSFER_MAX_RETRIES', os.getenv('SFTP_MAX_RETRIES', '3')))
     TRANSFER_RETRY_DELAY = int(os.getenv('TRANSFER_RETRY_DELAY', os.getenv('SFTP_RETRY_DELAY', '1')))
 
+    # Transfer scheduler configuration (shared by FTP/SFTP/unified clients)
+    TRANSFER_WORKERS = int(os.getenv('TRANSFER_WORKERS', '8'))
+    TRANSFER_PER_HOST_LIMIT = int(os.getenv('TRANSFER_PER_HOST_LIMIT', '4'))
+
     # Legacy SFTP properties for backward compatibility
     @property
     def SFTP_HOST(self):
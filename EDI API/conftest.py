@@ -31,3 +31,17 @@ def cleanup_output_dir():
     if test_output.exists():
         import shutil
         shutil.rmtree(test_output)
+
+
+@pytest.fixture
+def ftp_server(tmp_path):
+    """Local in-process FTP server serving a temporary directory."""
+    from tests.servers import LocalFTPServer
+
+    server = LocalFTPServer(str(tmp_path / 'ftp_root'))
+    server.root.mkdir(parents=True, exist_ok=True)
+    server.start()
+
+    yield server
+
+    server.stop()
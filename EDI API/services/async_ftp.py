@@ -0,0 +1,370 @@
+"""
+Native asyncio FTP client.
+Implements the subset of RFC 959 needed by the transfer layer on top of asyncio streams,
+so FTP transfers run directly on the event loop instead of occupying a worker thread.
+
+Supported commands:
+- Control connection: USER/PASS login, TYPE I, PWD, CWD, QUIT
+- Passive data connections: PASV (falls back to EPSV)
+- STOR: upload a local file or in-memory bytes
+- RNFR/RNTO: rename a remote file
+- MKD: create a remote directory
+- NLST: list names in a remote directory
+
+Every connection owns its own control and data sockets, so thousands of transfers
+can run concurrently on a single loop.
+"""
+
+import asyncio
+import logging
+import re
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Size of the chunks streamed over the data connection
+_CHUNK_SIZE = 64 * 1024
+
+_PASV_RE = re.compile(r'(\d+),(\d+),(\d+),(\d+),(\d+),(\d+)')
+_EPSV_RE = re.compile(r'\(([^\d])\1\1(\d+)\1\)')
+
+
+class FTPReplyError(IOError):
+    """Raised when the server answers a command with an error reply."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(f"{code} {message}")
+        self.code = code
+        self.message = message
+
+
+class FTPTemporaryError(FTPReplyError):
+    """4xx reply: transient failure, the command may succeed if retried."""
+
+
+class FTPPermanentError(FTPReplyError):
+    """5xx reply: the command was rejected."""
+
+
+class AsyncFTPConnection:
+    """
+    Single FTP session driven by asyncio streams.
+
+    Usage:
+        async with AsyncFTPConnection(host, port) as ftp:
+            await ftp.login(user, password)
+            await ftp.ensure_cwd('/incoming')
+            await ftp.stor_file('/tmp/CODECO.edi')
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 21,
+        timeout: float = 30.0,
+        encoding: str = 'utf-8'
+    ):
+        """
+        Initialize FTP connection parameters (no network I/O happens here).
+
+        Args:
+            host: FTP server hostname or IP address.
+            port: FTP server port (default: 21).
+            timeout: Seconds to wait for connect, replies and data transfers (default: 30).
+            encoding: Encoding used for commands and file names (default: 'utf-8').
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.encoding = encoding
+        self.welcome: Optional[str] = None
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    @property
+    def is_connected(self) -> bool:
+        """True while the control connection is open."""
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def __aenter__(self) -> 'AsyncFTPConnection':
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            await self.quit()
+        else:
+            await self.close()
+
+    # ==================== CONTROL CONNECTION ====================
+
+    async def connect(self) -> str:
+        """
+        Open the control connection and read the server greeting.
+
+        Returns:
+            str: Server welcome message.
+
+        Raises:
+            FTPReplyError: If the server refuses the connection.
+            OSError: If the TCP connection cannot be established.
+        """
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port),
+            self.timeout
+        )
+        _, self.welcome = await self._expect((2,))
+        return self.welcome
+
+    async def login(self, username: str, password: str) -> None:
+        """
+        Authenticate and switch the session to binary (image) mode.
+
+        Raises:
+            FTPPermanentError: If the credentials are rejected.
+        """
+        code, _ = await self._command(f'USER {username}', expect=(2, 3))
+        if code // 100 == 3:
+            await self._command(f'PASS {password}', expect=(2,))
+        await self._command('TYPE I', expect=(2,))
+
+    async def pwd(self) -> str:
+        """Return the current remote working directory."""
+        _, message = await self._command('PWD', expect=(2,))
+        match = re.search(r'"((?:[^"]|"")*)"', message)
+        return match.group(1).replace('""', '"') if match else message
+
+    async def cwd(self, path: str) -> None:
+        """Change the remote working directory."""
+        await self._command(f'CWD {path}', expect=(2,))
+
+    async def mkd(self, path: str) -> str:
+        """
+        Create a remote directory.
+
+        Returns:
+            str: Path of the created directory as reported by the server.
+        """
+        _, message = await self._command(f'MKD {path}', expect=(2,))
+        match = re.search(r'"((?:[^"]|"")*)"', message)
+        return match.group(1).replace('""', '"') if match else path
+
+    async def ensure_cwd(self, remote_dir: str) -> None:
+        """
+        Change into remote_dir, creating it first if it does not exist.
+
+        Mirrors the behaviour of the former ftplib upload path: a failure to
+        create the directory is logged and the upload goes to the current directory.
+        """
+        if not remote_dir or remote_dir == '/':
+            return
+        try:
+            await self.cwd(remote_dir)
+        except FTPPermanentError:
+            try:
+                await self.mkd(remote_dir)
+            except FTPPermanentError:
+                # Another session may have created it concurrently
+                pass
+            try:
+                await self.cwd(remote_dir)
+            except FTPPermanentError:
+                logger.warning("Could not create/access directory %s", remote_dir)
+
+    async def rename(self, from_name: str, to_name: str) -> None:
+        """Rename a remote file using RNFR/RNTO."""
+        await self._command(f'RNFR {from_name}', expect=(3,))
+        await self._command(f'RNTO {to_name}', expect=(2,))
+
+    async def nlst(self, path: str = '') -> List[str]:
+        """
+        List file names in a remote directory.
+
+        An empty directory is reported by some servers as a 450/550 reply;
+        450 is treated as an empty listing.
+
+        Returns:
+            List[str]: Names returned by the server.
+        """
+        command = f'NLST {path}' if path else 'NLST'
+        try:
+            data = await self._retrieve(command)
+        except FTPTemporaryError as e:
+            if e.code == 450:
+                return []
+            raise
+        return [line for line in data.decode(self.encoding).splitlines() if line]
+
+    async def stor(self, remote_name: str, data: bytes) -> None:
+        """Upload in-memory bytes to remote_name."""
+        data_reader, data_writer = await self._open_data_connection()
+        try:
+            await self._command(f'STOR {remote_name}', expect=(1,))
+            data_writer.write(data)
+            await asyncio.wait_for(data_writer.drain(), self.timeout)
+        finally:
+            await self._close_stream(data_writer)
+        await self._expect((2,))
+
+    async def stor_file(self, local_file_path: str, remote_name: Optional[str] = None) -> int:
+        """
+        Upload a local file, streaming it over the data connection in chunks.
+
+        Args:
+            local_file_path: Path of the file to upload.
+            remote_name: Remote file name (default: basename of local_file_path).
+
+        Returns:
+            int: Number of bytes sent.
+        """
+        if remote_name is None:
+            remote_name = Path(local_file_path).name
+
+        sent = 0
+        with open(local_file_path, 'rb') as source:
+            data_reader, data_writer = await self._open_data_connection()
+            try:
+                await self._command(f'STOR {remote_name}', expect=(1,))
+                while True:
+                    chunk = source.read(_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    data_writer.write(chunk)
+                    await asyncio.wait_for(data_writer.drain(), self.timeout)
+                    sent += len(chunk)
+            finally:
+                await self._close_stream(data_writer)
+        await self._expect((2,))
+        return sent
+
+    async def quit(self) -> None:
+        """Send QUIT and close the control connection."""
+        if self.is_connected:
+            try:
+                await self._command('QUIT', expect=(2,))
+            except (FTPReplyError, OSError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+                pass
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the control connection without sending QUIT."""
+        writer, self._writer, self._reader = self._writer, None, None
+        if writer is not None:
+            await self._close_stream(writer)
+
+    # ==================== PROTOCOL HELPERS ====================
+
+    async def _command(self, line: str, expect: Tuple[int, ...]) -> Tuple[int, str]:
+        """Send a command on the control connection and read its reply."""
+        if not self.is_connected:
+            raise ConnectionError("FTP control connection is not open")
+        self._writer.write(f'{line}\r\n'.encode(self.encoding))
+        await asyncio.wait_for(self._writer.drain(), self.timeout)
+        return await self._expect(expect)
+
+    async def _expect(self, expect: Tuple[int, ...]) -> Tuple[int, str]:
+        """Read a reply and raise if its first digit is not in expect."""
+        code, message = await self._read_reply()
+        if code // 100 in expect:
+            return code, message
+        if 400 <= code < 500:
+            raise FTPTemporaryError(code, message)
+        if code >= 500:
+            raise FTPPermanentError(code, message)
+        raise FTPReplyError(code, message)
+
+    async def _read_reply(self) -> Tuple[int, str]:
+        """Read a (possibly multi-line) reply from the control connection."""
+        line = await self._read_line()
+        if len(line) < 3 or not line[:3].isdigit():
+            raise FTPReplyError(0, f"Malformed reply: {line!r}")
+        code = line[:3]
+        lines = [line[4:]]
+        if line[3:4] == '-':
+            # Multi-line reply ends with "<code> <text>"
+            while True:
+                line = await self._read_line()
+                if line.startswith(f'{code} '):
+                    lines.append(line[4:])
+                    break
+                lines.append(line)
+        return int(code), '\n'.join(lines)
+
+    async def _read_line(self) -> str:
+        raw = await asyncio.wait_for(self._reader.readline(), self.timeout)
+        if not raw:
+            raise ConnectionError("FTP control connection closed by server")
+        return raw.decode(self.encoding, errors='replace').rstrip('\r\n')
+
+    async def _open_data_connection(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Negotiate a passive-mode data connection (PASV, then EPSV)."""
+        try:
+            _, message = await self._command('PASV', expect=(2,))
+            match = _PASV_RE.search(message)
+            if not match:
+                raise FTPReplyError(227, f"Cannot parse PASV reply: {message}")
+            numbers = [int(n) for n in match.groups()]
+            port = (numbers[4] << 8) + numbers[5]
+        except FTPPermanentError:
+            _, message = await self._command('EPSV', expect=(2,))
+            match = _EPSV_RE.search(message)
+            if not match:
+                raise FTPReplyError(229, f"Cannot parse EPSV reply: {message}")
+            port = int(match.group(2))
+
+        # Like ftplib, ignore the address advertised in PASV replies (often a
+        # private or NAT address) and connect to the control connection peer.
+        peer_host = self._writer.get_extra_info('peername')[0]
+        return await asyncio.wait_for(
+            asyncio.open_connection(peer_host, port),
+            self.timeout
+        )
+
+    async def _retrieve(self, command: str) -> bytes:
+        """Run a command that sends its result over a data connection."""
+        data_reader, data_writer = await self._open_data_connection()
+        try:
+            await self._command(command, expect=(1,))
+            data = await asyncio.wait_for(data_reader.read(), self.timeout)
+        finally:
+            await self._close_stream(data_writer)
+        await self._expect((2,))
+        return data
+
+    @staticmethod
+    async def _close_stream(writer: asyncio.StreamWriter) -> None:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (OSError, ConnectionError):
+            pass
+
+
+async def upload_file_ftp_async(
+    host: str,
+    port: int,
+    username: str,
+    password: str,
+    remote_dir: str,
+    local_file_path: str,
+    remote_file_name: Union[str, None] = None,
+    timeout: float = 30.0
+) -> int:
+    """
+    Upload one file over a fresh FTP session.
+
+    Connects, logs in, changes into (or creates) remote_dir, stores the file
+    and closes the session.
+
+    Returns:
+        int: Number of bytes sent.
+
+    Raises:
+        FTPReplyError: If the server rejects a command.
+        OSError: If the connection or local file I/O fails.
+    """
+    async with AsyncFTPConnection(host, port, timeout=timeout) as ftp:
+        await ftp.login(username, password)
+        await ftp.ensure_cwd(remote_dir)
+        return await ftp.stor_file(local_file_path, remote_file_name)
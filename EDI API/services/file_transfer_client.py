@@ -7,14 +7,12 @@ import asyncio
 import logging
 from typing import Optional, Literal
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor
-import ftplib
 import paramiko
 
-logger = logging.getLogger(__name__)
+from services.async_ftp import FTPReplyError, FTPPermanentError, FTPTemporaryError, upload_file_ftp_async
+from services.transfer_scheduler import PRIORITY_NORMAL, get_scheduler
 
-# Thread pool for running blocking operations
-_executor = ThreadPoolExecutor(max_workers=5)
+logger = logging.getLogger(__name__)
 
 ProtocolType = Literal['ftp', 'sftp', 'auto']
 
@@ -38,7 +36,8 @@ class UnifiedFileTransferClient:
         remote_dir: str = '/',
         protocol: ProtocolType = 'auto',
         max_retries: int = 3,
-        retry_delay: int = 1
+        retry_delay: int = 1,
+        priority: int = PRIORITY_NORMAL
     ):
         """
         Initialize unified file transfer client.
@@ -52,6 +51,7 @@ class UnifiedFileTransferClient:
             protocol: Protocol to use ('ftp', 'sftp', or 'auto').
             max_retries: Maximum retry attempts (default: 3).
             retry_delay: Initial delay between retries (default: 1).
+            priority: Transfer scheduler lane (default: PRIORITY_NORMAL).
         """
         self.host = host
         self.port = port
@@ -61,6 +61,7 @@ class UnifiedFileTransferClient:
         self.protocol = protocol
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.priority = priority
         
         # Determine actual protocol to use
         self._detected_protocol = self._detect_protocol()
@@ -177,55 +178,35 @@ class UnifiedFileTransferClient:
         local_file_path: str,
         remote_file_name: str
     ) -> None:
-        """Upload file using FTP protocol."""
-        loop = asyncio.get_event_loop()
-
-        def _ftp_upload_sync():
-            try:
-                # Create FTP connection
-                ftp = ftplib.FTP()
-                ftp.connect(self.host, self.port)
-                ftp.login(self.username, self.password)
-
-                try:
-                    # Change to remote directory if specified
-                    if self.remote_dir and self.remote_dir != '/':
-                        try:
-                            ftp.cwd(self.remote_dir)
-                        except ftplib.error_perm:
-                            # Directory might not exist, try to create it
-                            try:
-                                ftp.mkd(self.remote_dir)
-                                ftp.cwd(self.remote_dir)
-                            except ftplib.error_perm:
-                                logger.warning(f"Could not create/access directory {self.remote_dir}")
-
-                    # Upload file in binary mode
-                    with open(local_file_path, 'rb') as file:
-                        ftp.storbinary(f'STOR {remote_file_name}', file)
-
-                finally:
-                    ftp.quit()
-
-            except ftplib.error_perm as e:
-                raise IOError(f"FTP permission error: {str(e)}")
-            except ftplib.error_temp as e:
-                raise IOError(f"FTP temporary error: {str(e)}")
-            except ftplib.all_errors as e:
-                raise IOError(f"FTP error: {str(e)}")
-            except Exception as e:
-                raise IOError(f"FTP transfer error: {str(e)}")
-
-        await loop.run_in_executor(_executor, _ftp_upload_sync)
+        """Upload file using FTP protocol (native asyncio, holding a scheduler host slot)."""
+        try:
+            async with get_scheduler().slot(self.host, self.priority):
+                await upload_file_ftp_async(
+                    self.host,
+                    self.port,
+                    self.username,
+                    self.password,
+                    self.remote_dir,
+                    local_file_path,
+                    remote_file_name
+                )
+        except FTPPermanentError as e:
+            raise IOError(f"FTP permission error: {str(e)}")
+        except FTPTemporaryError as e:
+            raise IOError(f"FTP temporary error: {str(e)}")
+        except asyncio.TimeoutError:
+            raise IOError(f"FTP error: timed out talking to {self.host}:{self.port}")
+        except (FTPReplyError, OSError) as e:
+            raise IOError(f"FTP error: {str(e)}")
+        except Exception as e:
+            raise IOError(f"FTP transfer error: {str(e)}")
 
     async def _upload_with_sftp(
         self,
         local_file_path: str,
         remote_file_name: str
     ) -> None:
-        """Upload file using SFTP protocol."""
-        loop = asyncio.get_event_loop()
-
+        """Upload file using SFTP protocol (on a transfer scheduler worker thread)."""
         def _sftp_upload_sync():
             try:
                 # Create SSH transport
@@ -263,7 +244,7 @@ class UnifiedFileTransferClient:
             except Exception as e:
                 raise IOError(f"SFTP transfer error: {str(e)}")
 
-        await loop.run_in_executor(_executor, _sftp_upload_sync)
+        await get_scheduler().run(_sftp_upload_sync, host=self.host, priority=self.priority)
 
 
 async def upload_edi_file_unified(
@@ -275,7 +256,8 @@ async def upload_edi_file_unified(
     remote_dir: str = '/',
     protocol: ProtocolType = 'auto',
     max_retries: int = 3,
-    retry_delay: int = 1
+    retry_delay: int = 1,
+    priority: int = PRIORITY_NORMAL
 ) -> bool:
     """
     Convenience function to upload an EDI file using unified client.
@@ -290,6 +272,7 @@ async def upload_edi_file_unified(
         protocol: Protocol to use ('ftp', 'sftp', or 'auto').
         max_retries: Maximum retry attempts.
         retry_delay: Initial delay between retries.
+        priority: Transfer scheduler lane.
 
     Returns:
         bool: True if upload succeeded, False otherwise.
@@ -302,7 +285,8 @@ async def upload_edi_file_unified(
         remote_dir=remote_dir,
         protocol=protocol,
         max_retries=max_retries,
-        retry_delay=retry_delay
+        retry_delay=retry_delay,
+        priority=priority
     )
 
     return await client.upload_file(local_edi_path)
\ No newline at end of file
@@ -1,20 +1,19 @@
 """
 FTP Client Service for asynchronous file uploads.
 Handles uploading EDI files to FTP server with retry logic and exponential backoff.
-Uses ftplib for FTP operations with async wrapper (run_in_executor).
+Uses the native asyncio FTP implementation in services.async_ftp, so uploads run on
+the event loop without occupying a worker thread.
 """
 
 import asyncio
 import logging
 from typing import Optional
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor
-import ftplib
 
-logger = logging.getLogger(__name__)
+from services.async_ftp import FTPReplyError, FTPPermanentError, FTPTemporaryError, upload_file_ftp_async
+from services.transfer_scheduler import PRIORITY_NORMAL, get_scheduler
 
-# Thread pool for running blocking FTP operations
-_executor = ThreadPoolExecutor(max_workers=5)
+logger = logging.getLogger(__name__)
 
 
 class FTPClient:
@@ -36,7 +35,8 @@ class FTPClient:
         password: str,
         remote_dir: str = '/',
         max_retries: int = 3,
-        retry_delay: int = 1
+        retry_delay: int = 1,
+        priority: int = PRIORITY_NORMAL
     ):
         """
         Initialize FTP client configuration.
@@ -50,6 +50,7 @@ class FTPClient:
             max_retries: Maximum number of retry attempts (default: 3).
             retry_delay: Initial delay in seconds between retry attempts (default: 1).
                         Uses exponential backoff: delay * (2 ^ attempt_number).
+            priority: Transfer scheduler lane (default: PRIORITY_NORMAL).
         """
         self.host = host
         self.port = port
@@ -58,6 +59,7 @@ class FTPClient:
         self.remote_dir = remote_dir.rstrip('/')
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.priority = priority
 
     async def upload_file(
         self,
@@ -104,7 +106,7 @@ class FTPClient:
                 )
 
                 # Perform FTP upload
-                await self._upload_with_ftplib(local_file_path, remote_file_name)
+                await self._upload_with_ftp(local_file_path, remote_file_name)
 
                 logger.info(
                     f"Successfully uploaded {local_file_path} to "
@@ -134,19 +136,17 @@ class FTPClient:
 
         return False
 
-    async def _upload_with_ftplib(
+    async def _upload_with_ftp(
         self,
         local_file_path: str,
         remote_file_name: str
     ) -> None:
         """
-        Perform FTP upload using ftplib library (run in thread pool for async).
+        Perform FTP upload over a native asyncio FTP session.
 
         This method handles the actual FTP connection and file transfer.
-        Connection is closed automatically after transfer.
-
-        Since ftplib is synchronous, this method runs in a thread pool executor
-        to provide async semantics without blocking the event loop.
+        Connection is closed automatically after transfer. The session holds a
+        transfer scheduler slot so per-host caps and priority lanes apply.
 
         Args:
             local_file_path: Full path to local file.
@@ -156,49 +156,27 @@ class FTPClient:
             IOError: If FTP connection or transfer fails.
             OSError: If file I/O fails.
         """
-        loop = asyncio.get_event_loop()
-
-        def _upload_sync():
-            """Synchronous FTP upload using ftplib."""
-            try:
-                # Create FTP connection
-                ftp = ftplib.FTP()
-                ftp.connect(self.host, self.port)
-                ftp.login(self.username, self.password)
-
-                try:
-                    # Change to remote directory if specified
-                    if self.remote_dir and self.remote_dir != '/':
-                        try:
-                            ftp.cwd(self.remote_dir)
-                        except ftplib.error_perm:
-                            # Directory might not exist, try to create it
-                            try:
-                                ftp.mkd(self.remote_dir)
-                                ftp.cwd(self.remote_dir)
-                            except ftplib.error_perm:
-                                logger.warning(f"Could not create/access directory {self.remote_dir}")
-
-                    # Upload file in binary mode
-                    with open(local_file_path, 'rb') as file:
-                        ftp.storbinary(f'STOR {remote_file_name}', file)
-
-                finally:
-                    ftp.quit()
-
-            except ftplib.error_perm as e:
-                raise IOError(f"FTP permission error: {str(e)}")
-            except ftplib.error_temp as e:
-                raise IOError(f"FTP temporary error: {str(e)}")
-            except ftplib.all_errors as e:
-                raise IOError(f"FTP error: {str(e)}")
-            except OSError as e:
-                raise IOError(f"File I/O error: {str(e)}")
-            except Exception as e:
-                raise IOError(f"Unexpected error during FTP transfer: {str(e)}")
-
-        # Run synchronous FTP operation in thread pool
-        await loop.run_in_executor(_executor, _upload_sync)
+        try:
+            async with get_scheduler().slot(self.host, self.priority):
+                await upload_file_ftp_async(
+                    self.host,
+                    self.port,
+                    self.username,
+                    self.password,
+                    self.remote_dir,
+                    local_file_path,
+                    remote_file_name
+                )
+        except FTPPermanentError as e:
+            raise IOError(f"FTP permission error: {str(e)}")
+        except FTPTemporaryError as e:
+            raise IOError(f"FTP temporary error: {str(e)}")
+        except asyncio.TimeoutError:
+            raise IOError(f"FTP error: timed out talking to {self.host}:{self.port}")
+        except (FTPReplyError, OSError) as e:
+            raise IOError(f"FTP error: {str(e)}")
+        except Exception as e:
+            raise IOError(f"Unexpected error during FTP transfer: {str(e)}")
 
 
 async def upload_edi_file_ftp(
@@ -209,7 +187,8 @@ async def upload_edi_file_ftp(
     ftp_password: str,
     ftp_remote_dir: str = '/',
     max_retries: int = 3,
-    retry_delay: int = 1
+    retry_delay: int = 1,
+    priority: int = PRIORITY_NORMAL
 ) -> bool:
     """
     Convenience function to upload an EDI file to FTP server.
@@ -226,6 +205,7 @@ async def upload_edi_file_ftp(
         ftp_remote_dir: Remote directory for upload.
         max_retries: Maximum retry attempts.
         retry_delay: Initial delay between retries.
+        priority: Transfer scheduler lane.
 
     Returns:
         bool: True if upload succeeded, False otherwise.
@@ -240,7 +220,8 @@ async def upload_edi_file_ftp(
         password=ftp_password,
         remote_dir=ftp_remote_dir,
         max_retries=max_retries,
-        retry_delay=retry_delay
+        retry_delay=retry_delay,
+        priority=priority
     )
 
     return await client.upload_file(local_edi_path)
\ No newline at end of file
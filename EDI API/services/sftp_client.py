@@ -1,7 +1,7 @@
 """
 SFTP Client Service for asynchronous file uploads.
 Handles uploading EDI files to SFTP server with retry logic and exponential backoff.
-Uses paramiko for SFTP operations with async wrapper (run_in_executor).
+Uses paramiko for SFTP operations, run on the shared transfer scheduler's worker threads.
 
 Note: asyncssh was considered but requires Rust compilation. Paramiko provides
 synchronous SFTP operations wrapped in asyncio for non-blocking I/O.
@@ -11,13 +11,11 @@ import asyncio
 import logging
 from typing import Optional
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor
 import paramiko
 
-logger = logging.getLogger(__name__)
+from services.transfer_scheduler import PRIORITY_NORMAL, get_scheduler
 
-# Thread pool for running blocking paramiko operations
-_executor = ThreadPoolExecutor(max_workers=5)
+logger = logging.getLogger(__name__)
 
 
 class SFTPClient:
@@ -39,7 +37,8 @@ class SFTPClient:
         password: str,
         remote_dir: str = '/',
         max_retries: int = 3,
-        retry_delay: int = 1
+        retry_delay: int = 1,
+        priority: int = PRIORITY_NORMAL
     ):
         """
         Initialize SFTP client configuration.
@@ -53,6 +52,7 @@ class SFTPClient:
             max_retries: Maximum number of retry attempts (default: 3).
             retry_delay: Initial delay in seconds between retry attempts (default: 1).
                         Uses exponential backoff: delay * (2 ^ attempt_number).
+            priority: Transfer scheduler lane (default: PRIORITY_NORMAL).
         """
         self.host = host
         self.port = port
@@ -61,6 +61,7 @@ class SFTPClient:
         self.remote_dir = remote_dir.rstrip('/')
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.priority = priority
 
     async def upload_file(
         self,
@@ -143,13 +144,13 @@ class SFTPClient:
         remote_file_path: str
     ) -> None:
         """
-        Perform SFTP upload using paramiko library (run in thread pool for async).
+        Perform SFTP upload using paramiko library (run on the transfer scheduler).
 
         This method handles the actual SSH connection and SFTP file transfer.
         Connection is closed automatically after transfer.
 
-        Since paramiko is synchronous, this method runs in a thread pool executor
-        to provide async semantics without blocking the event loop.
+        Since paramiko is synchronous, this method runs on a transfer scheduler
+        worker thread to provide async semantics without blocking the event loop.
 
         Args:
             local_file_path: Full path to local file.
@@ -159,8 +160,6 @@ class SFTPClient:
             IOError: If SSH/SFTP connection or transfer fails.
             OSError: If file I/O fails.
         """
-        loop = asyncio.get_event_loop()
-
         def _upload_sync():
             """Synchronous SFTP upload using paramiko."""
             try:
@@ -187,8 +186,8 @@ class SFTPClient:
             except Exception as e:
                 raise IOError(f"Unexpected error during SFTP transfer: {str(e)}")
 
-        # Run synchronous SFTP operation in thread pool
-        await loop.run_in_executor(_executor, _upload_sync)
+        # Run synchronous SFTP operation on a scheduler worker thread
+        await get_scheduler().run(_upload_sync, host=self.host, priority=self.priority)
 
 
 async def upload_edi_file(
@@ -199,7 +198,8 @@ async def upload_edi_file(
     sftp_password: str,
     sftp_remote_dir: str = '/',
     max_retries: int = 3,
-    retry_delay: int = 1
+    retry_delay: int = 1,
+    priority: int = PRIORITY_NORMAL
 ) -> bool:
     """
     Convenience function to upload an EDI file to SFTP server.
@@ -216,6 +216,7 @@ async def upload_edi_file(
         sftp_remote_dir: Remote directory for upload.
         max_retries: Maximum retry attempts.
         retry_delay: Initial delay between retries.
+        priority: Transfer scheduler lane.
 
     Returns:
         bool: True if upload succeeded, False otherwise.
@@ -230,7 +231,8 @@ async def upload_edi_file(
         password=sftp_password,
         remote_dir=sftp_remote_dir,
         max_retries=max_retries,
-        retry_delay=retry_delay
+        retry_delay=retry_delay,
+        priority=priority
     )
 
     return await client.upload_file(local_edi_path)
@@ -0,0 +1,364 @@
+"""
+Transfer Scheduler shared by all file transfer clients.
+Replaces the per-module ThreadPoolExecutor instances with one process-wide scheduler.
+
+SCHEDULING MODEL:
+================
+- Worker threads: blocking work (paramiko SFTP sessions) runs on a bounded set of
+  worker threads, started lazily so an idle process holds no threads.
+- Per-host caps: no more than `per_host_limit` transfers run against the same
+  host at once, whether they are blocking jobs or native asyncio FTP sessions.
+- Priority lanes: queued work is dispatched in lane order (high, normal, backlog),
+  FIFO within a lane, so live gate messages overtake backlog resends.
+- Observability: queue depth per lane, in-flight transfers per host and queue wait
+  times are available from stats().
+"""
+
+import asyncio
+import bisect
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Priority lanes (lower value is dispatched first)
+PRIORITY_HIGH = 0      # Live gate traffic (e.g. gate-out messages)
+PRIORITY_NORMAL = 1    # Regular uploads
+PRIORITY_BACKLOG = 2   # Resends and replays
+
+LANE_NAMES = {
+    PRIORITY_HIGH: 'high',
+    PRIORITY_NORMAL: 'normal',
+    PRIORITY_BACKLOG: 'backlog',
+}
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_PER_HOST_LIMIT = 4
+
+
+class _Job:
+    """Queued unit of work: a blocking callable, or a slot for async work when fn is None."""
+
+    __slots__ = ('priority', 'seq', 'host', 'fn', 'future', 'enqueued_at', 'granted')
+
+    def __init__(self, priority: int, seq: int, host: Optional[str], fn: Optional[Callable[[], Any]]):
+        self.priority = priority
+        self.seq = seq
+        self.host = host
+        self.fn = fn
+        self.future: Future = Future()
+        self.enqueued_at = time.monotonic()
+        self.granted = False
+
+    def __lt__(self, other: '_Job') -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class _WaitStats:
+    """Running queue-wait statistics for one lane."""
+
+    __slots__ = ('count', 'total', 'max', 'last')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            'count': self.count,
+            'avg': self.total / self.count if self.count else 0.0,
+            'max': self.max,
+            'last': self.last,
+        }
+
+
+class TransferScheduler:
+    """
+    Process-wide scheduler for file transfers.
+
+    Blocking callables are submitted with submit()/run() and execute on worker
+    threads; native asyncio transfers reserve a host slot with slot(). Both share
+    the same per-host caps and priority lanes.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        per_host_limit: int = DEFAULT_PER_HOST_LIMIT
+    ):
+        """
+        Initialize the scheduler (no threads are started until work arrives).
+
+        Args:
+            max_workers: Maximum number of worker threads for blocking transfers (default: 8).
+            per_host_limit: Maximum concurrent transfers per remote host (default: 4).
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if per_host_limit < 1:
+            raise ValueError("per_host_limit must be at least 1")
+
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+
+        self._cond = threading.Condition()
+        self._queue: List[_Job] = []
+        self._seq = itertools.count()
+        self._host_active: Dict[Optional[str], int] = {}
+        self._threads: List[threading.Thread] = []
+        self._idle_workers = 0
+        self._busy_workers = 0
+        self._wait_stats = {lane: _WaitStats() for lane in LANE_NAMES}
+        self._shutdown = False
+
+    # ==================== PUBLIC API ====================
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        host: Optional[str] = None,
+        priority: int = PRIORITY_NORMAL,
+        **kwargs: Any
+    ) -> Future:
+        """
+        Queue a blocking callable for execution on a worker thread.
+
+        Args:
+            fn: Callable to run.
+            host: Remote host the work talks to (used for per-host caps).
+            priority: Lane to queue the job in (PRIORITY_HIGH/NORMAL/BACKLOG).
+
+        Returns:
+            concurrent.futures.Future resolving to the callable's result.
+        """
+        job = self._enqueue(host, priority, lambda: fn(*args, **kwargs))
+        return job.future
+
+    async def run(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        host: Optional[str] = None,
+        priority: int = PRIORITY_NORMAL,
+        **kwargs: Any
+    ) -> Any:
+        """Awaitable variant of submit() for use from coroutines."""
+        return await asyncio.wrap_future(
+            self.submit(fn, *args, host=host, priority=priority, **kwargs)
+        )
+
+    @asynccontextmanager
+    async def slot(self, host: Optional[str], priority: int = PRIORITY_NORMAL):
+        """
+        Reserve a per-host transfer slot for work that runs on the event loop.
+
+        Usage:
+            async with scheduler.slot(host, PRIORITY_HIGH):
+                await upload_file_ftp_async(...)
+        """
+        job = self._enqueue(host, priority, None)
+        try:
+            await asyncio.wrap_future(job.future)
+        except asyncio.CancelledError:
+            self._abandon(job)
+            raise
+        try:
+            yield
+        finally:
+            self._release(host)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of scheduler state.
+
+        Returns:
+            Dict with worker counts, queue depth per lane, in-flight transfers per
+            host and queue wait-time statistics (seconds) per lane.
+        """
+        with self._cond:
+            depth = {name: 0 for name in LANE_NAMES.values()}
+            for job in self._queue:
+                depth[LANE_NAMES.get(job.priority, 'backlog')] += 1
+            return {
+                'max_workers': self.max_workers,
+                'per_host_limit': self.per_host_limit,
+                'workers_started': len(self._threads),
+                'busy_workers': self._busy_workers,
+                'queue_depth': depth,
+                'queued_total': len(self._queue),
+                'in_flight_by_host': {
+                    (host or 'unknown'): count
+                    for host, count in self._host_active.items() if count
+                },
+                'wait_seconds': {
+                    LANE_NAMES[lane]: stats.as_dict() for lane, stats in self._wait_stats.items()
+                },
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work, cancel queued jobs and stop worker threads."""
+        with self._cond:
+            self._shutdown = True
+            pending, self._queue = self._queue, []
+            self._cond.notify_all()
+        for job in pending:
+            job.future.cancel()
+        if wait:
+            for thread in list(self._threads):
+                thread.join()
+
+    # ==================== INTERNALS ====================
+
+    def _enqueue(self, host: Optional[str], priority: int, fn: Optional[Callable[[], Any]]) -> _Job:
+        priority = min(max(priority, PRIORITY_HIGH), PRIORITY_BACKLOG)
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("Transfer scheduler has been shut down")
+            job = _Job(priority, next(self._seq), host, fn)
+            bisect.insort(self._queue, job)
+            self._grant_slots_locked()
+            if fn is not None:
+                if self._idle_workers == 0 and len(self._threads) < self.max_workers:
+                    self._start_worker_locked()
+                self._cond.notify()
+        return job
+
+    def _start_worker_locked(self) -> None:
+        thread = threading.Thread(
+            target=self._worker,
+            name=f'transfer-worker-{len(self._threads) + 1}',
+            daemon=True
+        )
+        self._threads.append(thread)
+        thread.start()
+
+    def _host_has_capacity(self, host: Optional[str]) -> bool:
+        return self._host_active.get(host, 0) < self.per_host_limit
+
+    def _take_locked(self, index: int) -> _Job:
+        job = self._queue.pop(index)
+        self._host_active[job.host] = self._host_active.get(job.host, 0) + 1
+        self._wait_stats[job.priority].record(time.monotonic() - job.enqueued_at)
+        return job
+
+    def _grant_slots_locked(self) -> None:
+        """Grant queued async slots whose host has capacity, in lane order."""
+        index = 0
+        while index < len(self._queue):
+            job = self._queue[index]
+            if job.fn is None and self._host_has_capacity(job.host):
+                if not job.future.set_running_or_notify_cancel():
+                    self._queue.pop(index)
+                    continue
+                self._take_locked(index)
+                job.granted = True
+                job.future.set_result(None)
+                continue
+            index += 1
+
+    def _next_job_locked(self) -> Optional[_Job]:
+        """Pop the highest-priority blocking job whose host has capacity."""
+        for index, job in enumerate(self._queue):
+            if job.fn is not None and self._host_has_capacity(job.host):
+                return self._take_locked(index)
+        return None
+
+    def _release(self, host: Optional[str]) -> None:
+        with self._cond:
+            self._host_active[host] = max(self._host_active.get(host, 0) - 1, 0)
+            self._grant_slots_locked()
+            self._cond.notify_all()
+
+    def _abandon(self, job: _Job) -> None:
+        """Drop a slot whose waiter was cancelled, releasing it if already granted."""
+        with self._cond:
+            if job.granted:
+                granted = True
+            else:
+                granted = False
+                if job in self._queue:
+                    self._queue.remove(job)
+        if granted:
+            self._release(job.host)
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                job = None
+                while not self._shutdown:
+                    job = self._next_job_locked()
+                    if job is not None:
+                        break
+                    self._idle_workers += 1
+                    self._cond.wait()
+                    self._idle_workers -= 1
+                if job is None:
+                    return
+                self._busy_workers += 1
+
+            try:
+                if job.future.set_running_or_notify_cancel():
+                    try:
+                        result = job.fn()
+                    except BaseException as e:
+                        job.future.set_exception(e)
+                    else:
+                        job.future.set_result(result)
+            finally:
+                with self._cond:
+                    self._busy_workers -= 1
+                    self._host_active[job.host] = max(self._host_active.get(job.host, 0) - 1, 0)
+                    self._grant_slots_locked()
+                    self._cond.notify_all()
+
+
+_scheduler: Optional[TransferScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def configure_scheduler(
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT
+) -> TransferScheduler:
+    """
+    Replace the process-wide scheduler with one using the given limits.
+
+    The previous scheduler (if any) finishes its queued work in the background.
+
+    Returns:
+        TransferScheduler: The new process-wide scheduler.
+    """
+    global _scheduler
+    with _scheduler_lock:
+        previous = _scheduler
+        _scheduler = TransferScheduler(max_workers=max_workers, per_host_limit=per_host_limit)
+    if previous is not None:
+        previous_stats = previous.stats()
+        if previous_stats['queued_total'] == 0 and previous_stats['busy_workers'] == 0:
+            previous.shutdown(wait=False)
+    return _scheduler
+
+
+def get_scheduler() -> TransferScheduler:
+    """Return the process-wide scheduler, creating it with default limits on first use."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = TransferScheduler()
+    return _scheduler
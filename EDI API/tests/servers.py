@@ -0,0 +1,233 @@
+"""
+In-process transfer servers for tests.
+Provides a minimal FTP server bound to localhost that serves a temporary directory,
+so transfer clients can be exercised end-to-end without external infrastructure.
+"""
+
+import asyncio
+import threading
+from pathlib import Path
+from typing import Optional
+
+
+class LocalFTPServer:
+    """
+    Minimal asyncio FTP server running on its own thread and event loop.
+
+    Implements USER/PASS, TYPE, PWD, CWD, MKD, PASV, EPSV, STOR, RETR, NLST,
+    SIZE, RNFR/RNTO, DELE, NOOP and QUIT against a local root directory.
+    Running on a separate loop lets synchronous (ftplib) and asynchronous
+    clients connect to it from any thread.
+    """
+
+    def __init__(self, root: str, username: str = 'testuser', password: str = 'testpass'):
+        self.root = Path(root).resolve()
+        self.username = username
+        self.password = password
+        self.host = '127.0.0.1'
+        self.port: Optional[int] = None
+        self.connections = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.base_events.Server] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+
+    def start(self) -> 'LocalFTPServer':
+        """Start the server thread and wait until it is listening."""
+        self._thread = threading.Thread(target=self._run, name='local-ftp-server', daemon=True)
+        self._thread.start()
+        self._ready.wait(10)
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and join its thread."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join(10)
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(
+            asyncio.start_server(self._handle_session, self.host, 0, backlog=4096)
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._server.close()
+            self._loop.run_until_complete(self._server.wait_closed())
+            self._loop.close()
+
+    def _resolve(self, cwd: str, path: str) -> Path:
+        virtual = path if path.startswith('/') else f"{cwd.rstrip('/')}/{path}"
+        resolved = (self.root / virtual.lstrip('/')).resolve()
+        if resolved != self.root and self.root not in resolved.parents:
+            raise PermissionError(path)
+        return resolved
+
+    async def _handle_session(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        state = {'cwd': '/', 'user': None, 'authed': False, 'passive': None, 'rnfr': None}
+
+        async def reply(line: str) -> None:
+            writer.write(f'{line}\r\n'.encode('utf-8'))
+            await writer.drain()
+
+        await reply('220 Local test FTP server ready')
+        try:
+            while True:
+                raw = await reader.readline()
+                if not raw:
+                    break
+                line = raw.decode('utf-8').rstrip('\r\n')
+                command, _, argument = line.partition(' ')
+                command = command.upper()
+                if command == 'QUIT':
+                    await reply('221 Goodbye')
+                    break
+                await self._dispatch(command, argument, state, reply)
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            await self._close_passive(state)
+            writer.close()
+
+    async def _dispatch(self, command: str, argument: str, state: dict, reply) -> None:
+        if command == 'USER':
+            state['user'] = argument
+            await reply('331 Password required')
+            return
+        if command == 'PASS':
+            if state['user'] == self.username and argument == self.password:
+                state['authed'] = True
+                await reply('230 Logged in')
+            else:
+                await reply('530 Login incorrect')
+            return
+        if not state['authed']:
+            await reply('530 Not logged in')
+            return
+
+        try:
+            if command == 'TYPE':
+                await reply('200 Type set')
+            elif command == 'NOOP':
+                await reply('200 OK')
+            elif command == 'PWD':
+                await reply(f'257 "{state["cwd"]}" is the current directory')
+            elif command == 'CWD':
+                target = self._resolve(state['cwd'], argument)
+                if not target.is_dir():
+                    await reply('550 No such directory')
+                    return
+                state['cwd'] = '/' + str(target.relative_to(self.root)).replace('\\', '/').lstrip('.')
+                await reply('250 Directory changed')
+            elif command == 'MKD':
+                target = self._resolve(state['cwd'], argument)
+                if target.exists():
+                    await reply('550 Directory exists')
+                    return
+                target.mkdir(parents=True)
+                await reply(f'257 "{argument}" created')
+            elif command in ('PASV', 'EPSV'):
+                await self._open_passive(state)
+                port = state['passive']['port']
+                if command == 'PASV':
+                    await reply(f'227 Entering Passive Mode (127,0,0,1,{port >> 8},{port & 0xFF})')
+                else:
+                    await reply(f'229 Entering Extended Passive Mode (|||{port}|)')
+            elif command == 'STOR':
+                target = self._resolve(state['cwd'], argument)
+                data_reader, data_writer = await self._accept_data(state)
+                await reply('150 Ready to receive')
+                content = await data_reader.read()
+                data_writer.close()
+                target.write_bytes(content)
+                await reply('226 Transfer complete')
+            elif command == 'RETR':
+                target = self._resolve(state['cwd'], argument)
+                if not target.is_file():
+                    await self._close_passive(state)
+                    await reply('550 No such file')
+                    return
+                data_reader, data_writer = await self._accept_data(state)
+                await reply('150 Sending file')
+                data_writer.write(target.read_bytes())
+                await data_writer.drain()
+                data_writer.close()
+                await reply('226 Transfer complete')
+            elif command == 'NLST':
+                target = self._resolve(state['cwd'], argument or '.')
+                if not target.is_dir():
+                    await self._close_passive(state)
+                    await reply('450 No files found')
+                    return
+                names = sorted(p.name for p in target.iterdir())
+                data_reader, data_writer = await self._accept_data(state)
+                await reply('150 Listing')
+                data_writer.write(''.join(f'{name}\r\n' for name in names).encode('utf-8'))
+                await data_writer.drain()
+                data_writer.close()
+                await reply('226 Listing complete')
+            elif command == 'SIZE':
+                target = self._resolve(state['cwd'], argument)
+                if not target.is_file():
+                    await reply('550 No such file')
+                    return
+                await reply(f'213 {target.stat().st_size}')
+            elif command == 'RNFR':
+                target = self._resolve(state['cwd'], argument)
+                if not target.exists():
+                    await reply('550 No such file')
+                    return
+                state['rnfr'] = target
+                await reply('350 Ready for RNTO')
+            elif command == 'RNTO':
+                if state['rnfr'] is None:
+                    await reply('503 RNFR required first')
+                    return
+                state['rnfr'].replace(self._resolve(state['cwd'], argument))
+                state['rnfr'] = None
+                await reply('250 Rename successful')
+            elif command == 'DELE':
+                self._resolve(state['cwd'], argument).unlink()
+                await reply('250 Deleted')
+            else:
+                await reply('502 Command not implemented')
+        except PermissionError:
+            await reply('550 Permission denied')
+        except FileNotFoundError:
+            await reply('550 No such file or directory')
+
+    async def _open_passive(self, state: dict) -> None:
+        await self._close_passive(state)
+        connected = asyncio.get_running_loop().create_future()
+
+        def _on_connect(data_reader, data_writer):
+            if not connected.done():
+                connected.set_result((data_reader, data_writer))
+
+        server = await asyncio.start_server(_on_connect, self.host, 0)
+        state['passive'] = {
+            'server': server,
+            'port': server.sockets[0].getsockname()[1],
+            'connected': connected,
+        }
+
+    async def _accept_data(self, state: dict):
+        passive = state['passive']
+        if passive is None:
+            raise ConnectionError('PASV required before data transfer')
+        try:
+            return await asyncio.wait_for(passive['connected'], 10)
+        finally:
+            await self._close_passive(state)
+
+    @staticmethod
+    async def _close_passive(state: dict) -> None:
+        passive, state['passive'] = state.get('passive'), None
+        if passive is not None:
+            passive['server'].close()
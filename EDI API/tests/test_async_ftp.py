@@ -0,0 +1,151 @@
+"""
+Unit tests for the native asyncio FTP client.
+Runs against the local in-process FTP server fixture.
+"""
+
+import pytest
+import asyncio
+import ftplib
+from pathlib import Path
+from services.async_ftp import AsyncFTPConnection, FTPPermanentError, upload_file_ftp_async
+from services.ftp_client import FTPClient, upload_edi_file_ftp
+from services.file_transfer_client import UnifiedFileTransferClient
+
+
+@pytest.fixture
+def edi_file(tmp_path):
+    """Fixture providing a local EDI file to upload."""
+    path = tmp_path / 'CODECO_TEST.edi'
+    path.write_text("UNB+UNOC:3+CIABJ31+419101+240425+0400+20240425040011'")
+    return str(path)
+
+
+class TestAsyncFTPConnection:
+    """Test cases for AsyncFTPConnection commands."""
+
+    @pytest.mark.asyncio
+    async def test_login_and_pwd(self, ftp_server):
+        """Test login and current directory reporting."""
+        async with AsyncFTPConnection(ftp_server.host, ftp_server.port) as ftp:
+            await ftp.login('testuser', 'testpass')
+            assert await ftp.pwd() == '/'
+
+    @pytest.mark.asyncio
+    async def test_login_rejected(self, ftp_server):
+        """Test that bad credentials raise FTPPermanentError."""
+        async with AsyncFTPConnection(ftp_server.host, ftp_server.port) as ftp:
+            with pytest.raises(FTPPermanentError) as exc_info:
+                await ftp.login('testuser', 'wrong')
+            assert exc_info.value.code == 530
+
+    @pytest.mark.asyncio
+    async def test_mkd_stor_nlst(self, ftp_server, edi_file):
+        """Test directory creation, upload and listing."""
+        async with AsyncFTPConnection(ftp_server.host, ftp_server.port) as ftp:
+            await ftp.login('testuser', 'testpass')
+            await ftp.mkd('incoming')
+            await ftp.cwd('incoming')
+            sent = await ftp.stor_file(edi_file)
+            await ftp.stor('second.edi', b"UNH+1'")
+
+            assert sent == Path(edi_file).stat().st_size
+            assert await ftp.nlst() == ['CODECO_TEST.edi', 'second.edi']
+
+        uploaded = ftp_server.root / 'incoming' / 'CODECO_TEST.edi'
+        assert uploaded.read_bytes() == Path(edi_file).read_bytes()
+
+    @pytest.mark.asyncio
+    async def test_rename(self, ftp_server):
+        """Test RNFR/RNTO rename of an uploaded file."""
+        async with AsyncFTPConnection(ftp_server.host, ftp_server.port) as ftp:
+            await ftp.login('testuser', 'testpass')
+            await ftp.stor('upload.tmp', b'data')
+            await ftp.rename('upload.tmp', 'upload.edi')
+            assert await ftp.nlst() == ['upload.edi']
+
+    @pytest.mark.asyncio
+    async def test_nlst_missing_directory_is_empty(self, ftp_server):
+        """Test that a 450 reply to NLST is reported as an empty listing."""
+        async with AsyncFTPConnection(ftp_server.host, ftp_server.port) as ftp:
+            await ftp.login('testuser', 'testpass')
+            assert await ftp.nlst('missing') == []
+
+    @pytest.mark.asyncio
+    async def test_ensure_cwd_creates_directory(self, ftp_server, edi_file):
+        """Test that ensure_cwd creates a missing remote directory."""
+        await upload_file_ftp_async(
+            ftp_server.host, ftp_server.port, 'testuser', 'testpass', '/ftp_output', edi_file
+        )
+        assert (ftp_server.root / 'ftp_output' / 'CODECO_TEST.edi').exists()
+
+    def test_ftplib_interoperability(self, ftp_server):
+        """Test that the fixture server speaks standard FTP (sanity check with ftplib)."""
+        ftp = ftplib.FTP()
+        ftp.connect(ftp_server.host, ftp_server.port)
+        ftp.login('testuser', 'testpass')
+        ftp.mkd('check')
+        assert ftp.nlst() == ['check']
+        ftp.quit()
+
+
+class TestFTPClientsNativeAsync:
+    """Test FTP upload paths of the transfer clients without a thread pool."""
+
+    @pytest.mark.asyncio
+    async def test_ftp_client_upload(self, ftp_server, edi_file):
+        """Test FTPClient upload to the local server."""
+        client = FTPClient(
+            host=ftp_server.host,
+            port=ftp_server.port,
+            username='testuser',
+            password='testpass',
+            remote_dir='/incoming/'
+        )
+        assert await client.upload_file(edi_file, 'renamed.edi') is True
+        assert (ftp_server.root / 'incoming' / 'renamed.edi').exists()
+
+    @pytest.mark.asyncio
+    async def test_ftp_client_auth_failure_raises_ioerror(self, ftp_server, edi_file):
+        """Test that rejected credentials surface as IOError after retries."""
+        client = FTPClient(
+            host=ftp_server.host,
+            port=ftp_server.port,
+            username='testuser',
+            password='wrong',
+            max_retries=2,
+            retry_delay=0
+        )
+        with pytest.raises(IOError) as exc_info:
+            await client.upload_file(edi_file)
+        assert "530" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_unified_client_ftp_branch(self, ftp_server, edi_file):
+        """Test the FTP branch of UnifiedFileTransferClient."""
+        client = UnifiedFileTransferClient(
+            host=ftp_server.host,
+            port=ftp_server.port,
+            username='testuser',
+            password='testpass',
+            remote_dir='/out',
+            protocol='ftp'
+        )
+        assert await client.upload_file(edi_file) is True
+        assert (ftp_server.root / 'out' / 'CODECO_TEST.edi').exists()
+
+    @pytest.mark.asyncio
+    async def test_many_concurrent_uploads_on_one_loop(self, ftp_server, tmp_path):
+        """Test that hundreds of uploads run concurrently on a single event loop."""
+        files = []
+        for i in range(300):
+            path = tmp_path / f'CODECO_{i:04d}.edi'
+            path.write_text(f"UNH+{i}'")
+            files.append(str(path))
+
+        results = await asyncio.gather(*[
+            upload_edi_file_ftp(path, ftp_server.host, ftp_server.port, 'testuser', 'testpass', '/bulk')
+            for path in files
+        ])
+
+        assert all(results)
+        assert len(list((ftp_server.root / 'bulk').iterdir())) == 300
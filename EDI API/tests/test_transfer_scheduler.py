@@ -0,0 +1,142 @@
+"""
+Unit tests for the shared transfer scheduler.
+Tests lazy worker start, priority lanes, per-host caps and exposed statistics.
+"""
+
+import pytest
+import asyncio
+import threading
+import time
+from services.transfer_scheduler import (
+    TransferScheduler,
+    PRIORITY_HIGH,
+    PRIORITY_NORMAL,
+    PRIORITY_BACKLOG
+)
+
+
+@pytest.fixture
+def scheduler():
+    """Fixture providing a single-worker scheduler."""
+    scheduler = TransferScheduler(max_workers=1, per_host_limit=1)
+    yield scheduler
+    scheduler.shutdown()
+
+
+class TestTransferScheduler:
+    """Test cases for TransferScheduler."""
+
+    def test_no_threads_until_work_is_submitted(self):
+        """Test that an idle scheduler holds no worker threads."""
+        scheduler = TransferScheduler(max_workers=4)
+        assert scheduler.stats()['workers_started'] == 0
+        assert scheduler.submit(lambda: 42).result(5) == 42
+        assert scheduler.stats()['workers_started'] == 1
+        scheduler.shutdown()
+
+    def test_invalid_limits_raise(self):
+        """Test that non-positive limits are rejected."""
+        with pytest.raises(ValueError):
+            TransferScheduler(max_workers=0)
+        with pytest.raises(ValueError):
+            TransferScheduler(per_host_limit=0)
+
+    def test_high_priority_jumps_backlog(self, scheduler):
+        """Test that queued high-priority work runs before queued backlog work."""
+        gate = threading.Event()
+        order = []
+
+        blocker = scheduler.submit(gate.wait, host='partner')
+        backlog = [
+            scheduler.submit(order.append, f'backlog-{i}', host='partner', priority=PRIORITY_BACKLOG)
+            for i in range(3)
+        ]
+        high = scheduler.submit(order.append, 'gate-out', host='partner', priority=PRIORITY_HIGH)
+
+        assert scheduler.stats()['queue_depth'] == {'high': 1, 'normal': 0, 'backlog': 3}
+        gate.set()
+        for future in [blocker, high, *backlog]:
+            future.result(5)
+
+        assert order[0] == 'gate-out'
+        assert order[1:] == ['backlog-0', 'backlog-1', 'backlog-2']
+
+    def test_per_host_limit(self):
+        """Test that concurrent work per host never exceeds the cap."""
+        scheduler = TransferScheduler(max_workers=6, per_host_limit=2)
+        lock = threading.Lock()
+        active = {'a': 0, 'b': 0}
+        peak = {'a': 0, 'b': 0}
+
+        def _work(host):
+            with lock:
+                active[host] += 1
+                peak[host] = max(peak[host], active[host])
+            time.sleep(0.02)
+            with lock:
+                active[host] -= 1
+
+        futures = [scheduler.submit(_work, host, host=host) for host in 'ab' * 6]
+        for future in futures:
+            future.result(5)
+        scheduler.shutdown()
+
+        assert peak == {'a': 2, 'b': 2}
+
+    def test_exceptions_propagate(self, scheduler):
+        """Test that exceptions raised by a job reach the caller."""
+        def _fail():
+            raise IOError("SFTP authentication error")
+
+        with pytest.raises(IOError):
+            scheduler.submit(_fail).result(5)
+
+    def test_wait_time_statistics(self, scheduler):
+        """Test that queue wait time is recorded per lane."""
+        gate = threading.Event()
+        scheduler.submit(gate.wait, host='h')
+        queued = scheduler.submit(lambda: None, host='h', priority=PRIORITY_NORMAL)
+        time.sleep(0.05)
+        gate.set()
+        queued.result(5)
+
+        wait = scheduler.stats()['wait_seconds']['normal']
+        assert wait['count'] == 2
+        assert wait['max'] >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_async_slot_respects_host_cap(self):
+        """Test that async slots share per-host caps and are released on exit."""
+        scheduler = TransferScheduler(per_host_limit=2)
+        active = 0
+        peak = 0
+
+        async def _transfer():
+            nonlocal active, peak
+            async with scheduler.slot('ftp.partner', PRIORITY_NORMAL):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*[_transfer() for _ in range(10)])
+
+        assert peak == 2
+        assert scheduler.stats()['in_flight_by_host'] == {}
+        assert scheduler.stats()['workers_started'] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_slot_waiter_is_dropped(self):
+        """Test that cancelling a queued slot waiter does not leak capacity."""
+        scheduler = TransferScheduler(per_host_limit=1)
+
+        async with scheduler.slot('h'):
+            waiter = asyncio.ensure_future(scheduler.slot('h').__aenter__())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+
+        assert scheduler.stats()['queued_total'] == 0
+        async with scheduler.slot('h'):
+            assert scheduler.stats()['in_flight_by_host'] == {'h': 1}